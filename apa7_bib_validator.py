@@ -19,6 +19,8 @@
 
 import argparse
 import gettext
+import math
+import random
 import re
 from abc import ABC, abstractmethod
 
@@ -155,13 +157,13 @@ def is_section_title(para, font_name='Times New Roman', font_size_pt=14):
             return True
     return False
 
-def get_bibliography_paragraphs(doc: Document):
+def iter_bibliography_paragraphs(doc: Document):
     """
-    Extract all non-empty paragraphs under the 'Bibliography' heading.
+    Yield (para, text) for each non-empty paragraph under the 'Bibliography'
+    heading, one at a time.
     Stops at the next section title or a blank-page marker.
     """
     in_bib = False
-    entries = []
     for para in doc.paragraphs:
         text = para.text.strip()
         if not in_bib:
@@ -171,8 +173,14 @@ def get_bibliography_paragraphs(doc: Document):
         if text == '[This page is deliberately left blank.]':
             break
         if text:
-            entries.append((para, text))
-    return entries
+            yield para, text
+
+def get_bibliography_paragraphs(doc: Document):
+    """
+    Extract all non-empty paragraphs under the 'Bibliography' heading.
+    Stops at the next section title or a blank-page marker.
+    """
+    return list(iter_bibliography_paragraphs(doc))
 
 # --- Abstract base class for APA citation types -------------------------
 
@@ -579,22 +587,163 @@ def diagnose_entry(para, text, idx):
     return 0
 
 
-def diagnose(docx_path):
-    doc = Document(docx_path)
-    entries = get_bibliography_paragraphs(doc)
+def sample_entries(entries, sample, rng):
+    """
+    Yield a reproducible random sample of (idx, para, text) entries.
+
+    An int K keeps a uniform sample of K entries (reservoir sampling, so
+    only K paragraphs are held at once); a float in (0, 1] keeps each entry
+    with that probability. Sampled entries come out in document order.
+
+    The same seed always gives the same sample:
+
+    >>> entries = [(i, None, str(i)) for i in range(1, 101)]
+    >>> a = list(sample_entries(iter(entries), 10, random.Random(7)))
+    >>> b = list(sample_entries(iter(entries), 10, random.Random(7)))
+    >>> a == b, len(a) == 10, [e[0] for e in a] == sorted(e[0] for e in a)
+    (True, True, True)
+
+    Every entry is equally likely to end up in a reservoir sample:
+
+    >>> counts = [0] * 4
+    >>> for seed in range(4000):
+    ...     for i, _para, _txt in sample_entries(iter(entries[:4]), 1, random.Random(seed)):
+    ...         counts[i - 1] += 1
+    >>> all(850 < c < 1150 for c in counts)
+    True
+    >>> len(list(sample_entries(iter(entries[:4]), 10, random.Random(0))))
+    4
+    """
+    if isinstance(sample, float):
+        for entry in entries:
+            if rng.random() < sample:
+                yield entry
+        return
 
-    # Validate each
+    reservoir = []
+    for n, entry in enumerate(entries):
+        if n < sample:
+            reservoir.append(entry)
+        else:
+            j = rng.randrange(n + 1)
+            if j < sample:
+                reservoir[j] = entry
+    reservoir.sort(key=lambda entry: entry[0])
+    yield from reservoir
+
+def wilson_interval(errors, n, population=None, z=1.96):
+    """
+    Wilson score interval for an error rate of errors/n (95% by default).
+
+    If the sample was drawn without replacement from a known population,
+    the half-width gets the finite population correction sqrt((N-n)/(N-1)).
+
+    >>> wilson_interval(0, 10)[0], wilson_interval(10, 10)[1]
+    (0.0, 1.0)
+    >>> low, high = wilson_interval(3, 20)
+    >>> round(low, 3), round(high, 3)
+    (0.052, 0.36)
+    >>> low_fpc, high_fpc = wilson_interval(3, 20, population=40)
+    >>> low < low_fpc < 0.15 < high_fpc < high
+    True
+    >>> wilson_interval(6, 20, population=20)
+    (0.3, 0.3)
+    """
+    if n == 0:
+        return 0.0, 1.0
+    p = errors / n
+    if population is not None and n >= population:
+        return p, p
+    denom = 1 + z * z / n
+    centre = (p + z * z / (2 * n)) / denom
+    half = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denom
+    if population is not None and population > 1:
+        half *= math.sqrt((population - n) / (population - 1))
+    low = 0.0 if errors == 0 else max(0.0, centre - half)
+    high = 1.0 if errors == n else min(1.0, centre + half)
+    return low, high
+
+def diagnose(docx_path, max_errors=None, sample=None, seed=0):
+    if max_errors is not None:
+        if max_errors < 1:
+            raise ValueError("max_errors must be a positive integer")
+        if sample is not None:
+            raise ValueError("max_errors and sample cannot be combined")
+    doc = Document(docx_path)
+    stats = {'total': 0, 'unsorted': False}
+
+    # Stream entries, tracking the count and alphabetical order as we go
+    def scan():
+        prev = None
+        for i, (para, txt) in enumerate(iter_bibliography_paragraphs(doc), 1):
+            surname = txt.split(',',1)[0].lower()
+            if prev is not None and surname < prev:
+                stats['unsorted'] = True
+            prev = surname
+            stats['total'] = i
+            yield i, para, txt
+
+    entries = scan()
+    if sample is not None:
+        entries = sample_entries(entries, sample, random.Random(seed))
+
+    # Validate each, stopping early once max_errors is reached
     errors = 0
-    for i, (para, txt) in enumerate(entries, 1):
+    checked = 0
+    stopped = False
+    for i, para, txt in entries:
+        checked += 1
         errors += diagnose_entry(para, txt, i)
+        if max_errors is not None and errors >= max_errors:
+            # Only a real stop if there were entries left to check
+            stopped = next(entries, None) is not None
+            break
 
     # Alphabetical check
-    surnames = [txt.split(',',1)[0].lower() for _, txt in entries]
-    if surnames != sorted(surnames):
+    if stats['unsorted']:
         console.print(_("⚠️ Entries are not in alphabetical order by surname.\n"), style="yellow")
 
+    if stopped:
+        console.print(
+            _("Stopped after {errors} entries with errors ({checked} entries checked).")
+            .format(errors=errors, checked=checked),
+            style="bold yellow"
+        )
+        console.print(
+            _("Alphabetical order was only checked for the first {scanned} entries.")
+            .format(scanned=stats['total']),
+            style="yellow"
+        )
+    elif sample is not None:
+        rate = errors / checked if checked else 0.0
+        if checked == 0 and stats['total'] > 0:
+            console.print(
+                _("No entries were sampled ({total} entries in document).")
+                .format(total=stats['total']),
+                style="bold red"
+            )
+        elif checked == stats['total']:
+            console.print(
+                _("Checked all {total} entries; error rate {rate:.1%}.")
+                .format(total=stats['total'], rate=rate),
+                style="bold yellow"
+            )
+        else:
+            low, high = wilson_interval(errors, checked, population=stats['total'])
+            console.print(
+                _("Sampled {checked} of {total} entries; estimated error rate {rate:.1%} (95% CI {low:.1%}–{high:.1%}).")
+                .format(checked=checked, total=stats['total'], rate=rate, low=low, high=high),
+                style="bold yellow"
+            )
+
     # Summary
-    if errors:
+    if stopped:
+        console.print(_("Entries with errors so far: {errors}").format(errors=errors), style="bold red")
+    elif sample is not None:
+        if checked or not stats['total']:
+            console.print(_("Sampled entries with errors: {errors}").format(errors=errors),
+                          style="bold red" if errors else "bold green")
+    elif errors:
         console.print(_("Total entries with errors: {errors}").format(errors=errors), style="bold red")
     else:
         console.print(_("✅ All entries look good!"), style="bold green")
@@ -614,6 +763,36 @@ def setup_gettext(lang_code: str):
         gettext.install(domain='apa7_bib_validator')
         _ = gettext.gettext
 
+def parse_sample(value: str):
+    """
+    Parse --sample as an entry count K (int) or a fraction in (0, 1] (float).
+
+    >>> parse_sample('1'), parse_sample('25'), parse_sample('0.1'), parse_sample('1.0')
+    (1, 25, 0.1, 1.0)
+    >>> for bad in ('0', '-3', '0.0', '1.5', '1e3', 'abc'):
+    ...     try:
+    ...         parse_sample(bad)
+    ...     except argparse.ArgumentTypeError:
+    ...         pass
+    ...     else:
+    ...         print('accepted', bad)
+    """
+    try:
+        k = int(value)
+    except ValueError:
+        pass
+    else:
+        if k < 1:
+            raise argparse.ArgumentTypeError("sample size must be a positive integer")
+        return k
+    try:
+        fraction = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid sample: {value!r}")
+    if not 0 < fraction <= 1:
+        raise argparse.ArgumentTypeError("sample fraction must be in (0, 1]")
+    return fraction
+
 def main():
     parser = argparse.ArgumentParser(
         description="Validate APA-7 bibliography entries in a .docx file."
@@ -629,9 +808,32 @@ def main():
         help="Locale code for messages (default: zh_CN)"
     )
 
+    triage = parser.add_mutually_exclusive_group()
+    triage.add_argument(
+        '--max-errors',
+        type=int,
+        metavar='N',
+        help="Stop validating the document once N entries have errors"
+    )
+    triage.add_argument(
+        '--sample',
+        type=parse_sample,
+        metavar='K|FRACTION',
+        help="Validate only a random sample of K entries (or a fraction in (0, 1]) "
+             "and estimate the error rate"
+    )
+    parser.add_argument(
+        '--seed',
+        type=int,
+        default=0,
+        help="Random seed for --sample, for reproducible samples (default: 0)"
+    )
+
     args = parser.parse_args()
+    if args.max_errors is not None and args.max_errors < 1:
+        parser.error("--max-errors must be a positive integer")
     setup_gettext(args.lang)
-    diagnose(args.docx_path)
+    diagnose(args.docx_path, max_errors=args.max_errors, sample=args.sample, seed=args.seed)
 
 if __name__ == '__main__':
     main()
\ No newline at end of file